@@ -66,6 +66,8 @@ class PrayTimes:
         if isha_minutes:
             self.params["isha"] = f"{isha_minutes} min"
         self.asr_factor = 1 if asr_method.lower() in {"standard", "shafi", "maliki", "hanbali"} else 2
+        self.angles = {key: self._get_param_angle(key) for key in ("imsak", "fajr", "maghrib", "isha")}
+        self.minutes = {key: self._get_param_minutes(key) for key in ("imsak", "maghrib", "isha")}
         self.lat = 0.0
         self.lng = 0.0
         self.jdate = 0.0
@@ -112,14 +114,14 @@ class PrayTimes:
 
     def _compute_times(self, times):
         times = {k: v / 24 for k, v in times.items()}
-        imsak = self._sun_angle_time(self._get_param_angle("imsak"), times["imsak"], "ccw")
-        fajr = self._sun_angle_time(self._get_param_angle("fajr"), times["fajr"], "ccw")
+        imsak = self._sun_angle_time(self.angles["imsak"], times["imsak"], "ccw")
+        fajr = self._sun_angle_time(self.angles["fajr"], times["fajr"], "ccw")
         sunrise = self._sun_angle_time(self._rise_set_angle(), times["sunrise"], "ccw")
         dhuhr = self._mid_day(times["dhuhr"])
         asr = self._asr_time(self.asr_factor, times["asr"])
         sunset = self._sun_angle_time(self._rise_set_angle(), times["sunset"], "cw")
-        maghrib = self._sun_angle_time(self._get_param_angle("maghrib"), times["maghrib"], "cw")
-        isha = self._sun_angle_time(self._get_param_angle("isha"), times["isha"], "cw")
+        maghrib = self._sun_angle_time(self.angles["maghrib"], times["maghrib"], "cw")
+        isha = self._sun_angle_time(self.angles["isha"], times["isha"], "cw")
         return {
             "imsak": imsak,
             "fajr": fajr,
@@ -149,15 +151,15 @@ class PrayTimes:
             times[key] = times[key] + tz_hours - self.lng / 15.0
         times["dhuhr"] += self.params.get("dhuhr", 0) / 60.0
 
-        imsak_minutes = self._get_param_minutes("imsak")
+        imsak_minutes = self.minutes["imsak"]
         if imsak_minutes:
             times["imsak"] = times["fajr"] - imsak_minutes / 60.0
 
-        maghrib_minutes = self._get_param_minutes("maghrib")
+        maghrib_minutes = self.minutes["maghrib"]
         if maghrib_minutes:
             times["maghrib"] = times["sunset"] + maghrib_minutes / 60.0
 
-        isha_minutes = self._get_param_minutes("isha")
+        isha_minutes = self.minutes["isha"]
         if isha_minutes:
             times["isha"] = times["sunset"] + isha_minutes / 60.0
 
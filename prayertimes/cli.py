@@ -5,7 +5,7 @@ import sys
 from .config import CONFIG_PATH, load_config, save_config
 from .geo import resolve_location
 from .methods import METHODS
-from .render import render_waybar
+from .render import get_timezone, render_waybar
 
 
 def handle_cli(args):
@@ -40,6 +40,35 @@ def handle_cli(args):
         save_config(config, CONFIG_PATH)
         return 0
 
+    if args.watch:
+        if args.tz:
+            try:
+                get_timezone(args.tz)
+            except (KeyError, ValueError):
+                raise ValueError(f"Unknown time zone: {args.tz}") from None
+        locations = config.setdefault("locations", {})
+        if args.watch not in locations:
+            locations[args.watch] = {
+                "query": args.watch,
+                "tz": args.tz or config.get("default_tz")
+            }
+        elif args.tz:
+            locations[args.watch]["tz"] = args.tz
+        resolve_location(config, args.watch, persist=True)
+        watch = config.setdefault("watch", [])
+        if args.watch not in watch:
+            watch.append(args.watch)
+        save_config(config, CONFIG_PATH)
+        return 0
+
+    if args.unwatch:
+        watch = config.get("watch", [])
+        if args.unwatch not in watch:
+            raise ValueError(f"Location not watched: {args.unwatch}")
+        watch.remove(args.unwatch)
+        save_config(config, CONFIG_PATH)
+        return 0
+
     if args.set_method:
         if args.set_method not in METHODS:
             raise ValueError(f"Unknown method: {args.set_method}")
@@ -93,7 +122,9 @@ def build_arg_parser():
     parser.add_argument("--set-location", help="Add or update a location and set it active (coords optional)")
     parser.add_argument("--lat", help="Latitude for --set-location")
     parser.add_argument("--lng", help="Longitude for --set-location")
-    parser.add_argument("--tz", help="IANA time zone for --set-location (optional)")
+    parser.add_argument("--tz", help="IANA time zone for --set-location or --watch (optional)")
+    parser.add_argument("--watch", help="Add a location to the tooltip watch list (auto resolves if not saved)")
+    parser.add_argument("--unwatch", help="Remove a location from the tooltip watch list")
     parser.add_argument("--set-method", help="Set calculation method")
     parser.add_argument("--set-offset", nargs=2, metavar=("PRAYER", "MIN"), help="Set prayer offset in minutes")
     return parser
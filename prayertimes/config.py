@@ -1,12 +1,15 @@
 import json
 import os
+import tempfile
 
 CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".config", "hyperland-prayertimes")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
+CACHE_PATH = os.path.join(CONFIG_DIR, "cache.json")
 
 DEFAULT_CONFIG = {
     "location": "Auto",
     "locations": {},
+    "watch": [],
     "default_tz": None,
     "default_country": None,
     "method": "Egyptian",
@@ -44,3 +47,25 @@ def save_config(config, path=CONFIG_PATH):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(config, f, indent=2)
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".cache-", suffix=".json", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
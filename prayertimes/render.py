@@ -8,7 +8,7 @@ except Exception:  # pragma: no cover
 from .calc import Coordinates, PrayTimes
 from .geo import auto_detect_location, resolve_location, clean_label
 from .methods import METHODS, PRAYER_ORDER
-from .config import save_config, CONFIG_PATH
+from .config import load_cache, save_cache, save_config, CACHE_PATH, CONFIG_PATH
 
 
 def get_timezone(tz_name):
@@ -95,6 +95,102 @@ def apply_adjustments(times, adjustments):
     return adjusted
 
 
+CALC_KEYS = [
+    ("method", "Egyptian"),
+    ("asr_method", "Standard"),
+    ("imsak_minutes", 10),
+    ("dhuhr_minutes", 0),
+    ("maghrib_minutes", 0),
+    ("isha_minutes", 0)
+]
+
+
+def calc_settings(config, loc):
+    return tuple(loc.get(key, config.get(key, default)) for key, default in CALC_KEYS)
+
+
+def cache_key(request):
+    settings, lat, lng, day, tz_hours = request
+    return "|".join(str(part) for part in (*settings, lat, lng, day.isoformat(), tz_hours))
+
+
+TABLE_KEYS = ["imsak", "fajr", "sunrise", "dhuhr", "asr", "sunset", "maghrib", "isha", "midnight"]
+
+
+def valid_cache_entry(entry):
+    if not isinstance(entry, dict) or not isinstance(entry.get("day"), str):
+        return False
+    times = entry.get("times")
+    if not isinstance(times, dict):
+        return False
+    return all(isinstance(times.get(key), (int, float)) for key in TABLE_KEYS)
+
+
+def compute_day_tables(requests):
+    cache = load_cache(CACHE_PATH)
+    first_day = min(day.isoformat() for _settings, _lat, _lng, day, _tz_hours in requests)
+    stale = [
+        key for key, entry in cache.items()
+        if not valid_cache_entry(entry) or entry["day"] < first_day
+    ]
+    for key in stale:
+        del cache[key]
+
+    pending = {}
+    for request in requests:
+        if cache_key(request) not in cache:
+            pending.setdefault(request[0], []).append(request)
+    for settings, group in pending.items():
+        pray = PrayTimes(*settings)
+        for request in group:
+            _settings, lat, lng, day, tz_hours = request
+            times = pray.get_times(day, Coordinates(lat=lat, lng=lng), tz_hours)
+            cache[cache_key(request)] = {"day": day.isoformat(), "times": times}
+
+    if pending or stale:
+        save_cache(cache, CACHE_PATH)
+    return {request: dict(cache[cache_key(request)]["times"]) for request in requests}
+
+
+def day_requests(config, loc, tzinfo, today):
+    settings = calc_settings(config, loc)
+    tomorrow = today + timedelta(days=1)
+    return (
+        (settings, loc["lat"], loc["lng"], today, tz_hours_for_day(today, tzinfo)),
+        (settings, loc["lat"], loc["lng"], tomorrow, tz_hours_for_day(tomorrow, tzinfo))
+    )
+
+
+def watched_locations(config, active_key):
+    watched = []
+    locations = config.get("locations", {})
+    for location_key in config.get("watch", []):
+        if location_key == active_key:
+            continue
+        loc = locations.get(location_key, {})
+        label = clean_label(loc.get("label") or location_key)
+        if "lat" not in loc or "lng" not in loc or calc_settings(config, loc)[0] not in METHODS:
+            watched.append((label, None, None))
+            continue
+        try:
+            tzinfo = get_timezone(loc.get("tz"))
+        except (KeyError, TypeError, ValueError):
+            watched.append((label, None, None))
+            continue
+        watched.append((location_key, loc, tzinfo))
+    return watched
+
+
+def build_watch_tooltip(entries, format_24h):
+    lines = ["", "Watched"]
+    for label, next_name, next_dt, countdown in entries:
+        if next_dt is None:
+            lines.append(f"{label}: unavailable")
+            continue
+        lines.append(f"{label}: {next_name} {format_time(next_dt, format_24h)} - {countdown}")
+    return "\n".join(lines)
+
+
 def render_waybar(config):
     location_key = config.get("location")
     if not location_key or location_key == "Auto":
@@ -103,26 +199,27 @@ def render_waybar(config):
     else:
         location_key, loc, _updated = resolve_location(config, location_key, persist=False)
 
-    coords = Coordinates(lat=loc["lat"], lng=loc["lng"])
     tzinfo = get_timezone(loc.get("tz"))
     today = datetime.now(tzinfo).date()
-    tz_hours_today = tz_hours_for_day(today, tzinfo)
+    active_requests = day_requests(config, loc, tzinfo, today)
 
-    method_key = config.get("method", "Egyptian")
-    asr_method = config.get("asr_method", "Standard")
-    imsak = config.get("imsak_minutes", 10)
-    dhuhr = config.get("dhuhr_minutes", 0)
-    maghrib = config.get("maghrib_minutes", 0)
-    isha = config.get("isha_minutes", 0)
+    watched = []
+    for watch_key, watch_loc, watch_tz in watched_locations(config, location_key):
+        if watch_loc is None:
+            watched.append((watch_key, None, None, None))
+            continue
+        watch_today = datetime.now(watch_tz).date()
+        watched.append((watch_key, watch_loc, watch_tz, day_requests(config, watch_loc, watch_tz, watch_today)))
 
-    pray = PrayTimes(method_key, asr_method, imsak, dhuhr, maghrib, isha)
-    times_today = pray.get_times(today, coords, tz_hours_today)
-    times_today = apply_adjustments(times_today, config.get("adjustments", {}))
+    requests = list(active_requests)
+    for _key, _loc, _tz, watch_requests in watched:
+        if watch_requests is not None:
+            requests.extend(watch_requests)
+    tables = compute_day_tables(requests)
 
-    tomorrow = today + timedelta(days=1)
-    tz_hours_tomorrow = tz_hours_for_day(tomorrow, tzinfo)
-    times_tomorrow = pray.get_times(tomorrow, coords, tz_hours_tomorrow)
-    times_tomorrow = apply_adjustments(times_tomorrow, config.get("adjustments", {}))
+    adjustments = config.get("adjustments", {})
+    times_today = apply_adjustments(tables[active_requests[0]], adjustments)
+    times_tomorrow = apply_adjustments(tables[active_requests[1]], adjustments)
 
     now = datetime.now(tzinfo)
     next_name, next_dt = next_prayer(now, tzinfo, times_today, times_tomorrow)
@@ -134,6 +231,7 @@ def render_waybar(config):
     display_format = config.get("display", {}).get("format", "{next_name} {next_time} - {countdown}")
     text = display_format.format(next_name=next_name, next_time=next_time, countdown=countdown)
 
+    method_key, asr_method = calc_settings(config, loc)[:2]
     location_label = clean_label(loc.get("label") or location_key)
     tooltip = build_tooltip(
         times_today,
@@ -145,6 +243,20 @@ def render_waybar(config):
         format_24h,
     )
 
+    watch_entries = []
+    for watch_key, watch_loc, watch_tz, watch_requests in watched:
+        if watch_loc is None:
+            watch_entries.append((watch_key, None, None, None))
+            continue
+        watch_today_times = apply_adjustments(tables[watch_requests[0]], adjustments)
+        watch_tomorrow_times = apply_adjustments(tables[watch_requests[1]], adjustments)
+        watch_now = datetime.now(watch_tz)
+        watch_name, watch_dt = next_prayer(watch_now, watch_tz, watch_today_times, watch_tomorrow_times)
+        watch_label = clean_label(watch_loc.get("label") or watch_key)
+        watch_entries.append((watch_label, watch_name, watch_dt, format_countdown(watch_dt - watch_now)))
+    if watch_entries:
+        tooltip = tooltip + "\n" + build_watch_tooltip(watch_entries, format_24h)
+
     return {
         "text": text,
         "tooltip": tooltip,